@@ -7,10 +7,20 @@ import re
 import sys
 
 
+DOC_OPEN = re.compile(r'^ *"""', re.M)
+DOC_CLOSE = re.compile(r'(^|[^\\])""" *$', re.M)
+DOC_SINGLELINE = re.compile(r'(^|[^\\])"""[^"]*""" *$', re.M)
+
+
 def error():
     raise Exception("Error: Unexpected end of file")
 
 
+def end_of_line(text, pos):
+    eol = text.find('\n', pos)
+    return len(text) if eol < 0 else eol + 1
+
+
 parser = argparse.ArgumentParser(description="Convert bilingually documented "
                                 "Python code to monolingual code")
 
@@ -18,41 +28,42 @@ parser.add_argument('--lang', choices=['en', 'ja'], default='en')
 parser.add_argument('PYFILE')
 args = parser.parse_args()
 
-inp = iter(open(args.PYFILE))
+with open(args.PYFILE) as f:
+    text = f.read()
 
+out = []
+pos = 0
+lang = 1 if args.lang == 'ja' else 0
 while True:
-    try:
-        line = next(inp)
-    except StopIteration:
+    m = DOC_OPEN.search(text, pos)
+    if not m:
         break
+    start = p = m.start()
     docs = []
-    while re.match(r' *"""', line):
-        doc = []
-        first_line = True
-        while True:
-            doc.append(line)
-            if (not first_line and re.search(r'(^|[^\\])""" *$', line)) or \
-               (first_line and re.search(r'(^|[^\\])"""[^"]*""" *$', line)):
-                break
-            try:
-                line = next(inp)
-            except StopIteration:
+    while m:
+        # A doc string either closes on its first line or on the first
+        # following line that ends with an unescaped triple quote.
+        eol = end_of_line(text, p)
+        if not DOC_SINGLELINE.search(text, p, eol):
+            m = DOC_CLOSE.search(text, eol)
+            if not m:
                 error()
-            first_line = False
-        try:
-            line = next(inp)
-        except StopIteration:
-            error()
-        docs.append(doc)
-
-    if docs:
-        lang = 1 if args.lang == 'ja' else 0
-        if len(docs) != 2:
-            print(f"{args.PYFILE}: Warning: The following doc string is not "
-                  "bilingual:", file=sys.stderr)
-            for s in docs[0]:
-                print(s, end='', file=sys.stderr)
-            lang = 0
-        for s in docs[lang]:
-            print(s, end='')
-    print(line, end='')
+            eol = end_of_line(text, m.end())
+        docs.append(text[p:eol])
+        p = eol
+        m = DOC_OPEN.match(text, p)
+    if p >= len(text):
+        error()
+
+    out.append(text[pos:start])
+    if len(docs) != 2:
+        print(f"{args.PYFILE}: Warning: The following doc string is not "
+              "bilingual:", file=sys.stderr)
+        sys.stderr.write(docs[0])
+        out.append(docs[0])
+    else:
+        out.append(docs[lang])
+    pos = p
+
+out.append(text[pos:])
+sys.stdout.writelines(out)
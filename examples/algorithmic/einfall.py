@@ -8,7 +8,6 @@
 from pytakt import *
 from pytakt.midiio import *
 import random
-import itertools
 
 table1 = [
     ["e~g~e~c~", "d~_g~g~~~|Tie()", "g|EndTie()ab^cf~~~|Tie()", 
@@ -55,14 +54,18 @@ table2 = [
 inst1 = newcontext(tk=1, ch=1, o=5, L=L8)
 inst2 = newcontext(tk=2, ch=2, o=4, L=L8)
 
+# Parse every phrase once; '+=' below copies the events.
+phrases1 = [[inst1.mml(s) for s in row] for row in table1]
+phrases2 = [[inst2.mml(s) for s in row] for row in table2]
+
 header = inst1.prog(gm.Flute) + inst2.prog(gm.Cello)
 
 def generate_six_measures():
     score1 = empty()
     score2 = empty()
     for i in range(6):
-        score1 += inst1.mml(table1[random.randrange(9)][i])
-        score2 += inst2.mml(table2[random.randrange(9)][i])
+        score1 += phrases1[random.randrange(9)][i]
+        score2 += phrases2[random.randrange(9)][i]
     return (score1, score2)
 
 def generate_twelve_measures():
@@ -71,6 +74,6 @@ def generate_twelve_measures():
     return (s1 & s2) + (s1.Modify('tk=2; ch=2; n-=12') &
                         s2.Modify('tk=1; ch=1; n+=12'))
 
-score = header + genseq(generate_twelve_measures() for _ in itertools.count())
+score = header + genseq(iter(generate_twelve_measures, None))
 
 end_score(score)
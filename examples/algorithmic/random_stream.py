@@ -34,21 +34,32 @@ from tkinter.messagebox import showerror
 
 GUI_UPDATE_PERIOD = 50
 
+PITCH_NAMES = [takt.Pitch(p).tostr(sfn='#b') for p in range(takt.A0, takt.C8)]
+ROOT_NAMES = [takt.Pitch(p).tostr(sfn='#b', octave=False)
+              for p in range(takt.C4, takt.C5)]
+
 
 # 1/f random number generator using Voss's algorithm
 class Rand1OverF:
     def __init__(self, ndice):
         self.ndice = ndice
-        self.count = -1
+        self.mask = (1 << ndice) - 1
+        self.count = self.mask  # so that all the dice are rolled first
         self.values = [0 for _ in range(ndice)]
+        self.scale = 1 / ndice
 
     def random(self):
-        newcount = (self.count + 1) % (1 << self.ndice)
-        for i in range(self.ndice):
-            if (self.count ^ newcount) & (1 << i):
+        newcount = (self.count + 1) & self.mask
+        # Only the dice corresponding to the changed bits are re-rolled.
+        changed = self.count ^ newcount
+        i = 0
+        while changed:
+            if changed & 1:
                 self.values[i] = random.random()
+            changed >>= 1
+            i += 1
         self.count = newcount
-        return sum(self.values) / self.ndice
+        return sum(self.values) * self.scale
 
     def randrange(self, start, stop):
         return start + int(self.random() * (stop - start))
@@ -105,22 +116,22 @@ class RandomStream(tkinter.Frame):
                            'cc', '{cccc}/', '{ccc}*/3', 'cc!!', 'c`c?',
                            '[cc]', '[ccc]']
         self.randtype = tkinter.StringVar(value='uniform')
+        # MML string -> list of (t1, t2, note, ctrls) or None
+        self.rhythm_cache = {}
         super().__init__(master)
         self.create_widgets()
         self.validate_all()
 
     def create_widgets(self):
-        pitches = [takt.Pitch(p).tostr(sfn='#b')
-                   for p in range(takt.A0, takt.C8)]
         pitch_frame = tkinter.Frame(self, relief='raised', borderwidth=2)
         tkinter.Label(pitch_frame, text="Pitch range:").pack(
             side=tkinter.LEFT, padx=20, pady=20)
         self.lowlimitbox = MyCombobox(
-            pitch_frame, values=pitches, initial='C4', width=4,
+            pitch_frame, values=PITCH_NAMES, initial='C4', width=4,
             validate=self.validate_limits, command=self.master.restart)
         self.lowlimitbox.pack(side=tkinter.LEFT, padx=20)
         self.highlimitbox = MyCombobox(
-            pitch_frame, values=pitches, initial='C6', width=4,
+            pitch_frame, values=PITCH_NAMES, initial='C6', width=4,
             validate=self.validate_limits, command=self.master.restart)
         self.highlimitbox.pack(side=tkinter.LEFT, padx=20)
         pitch_frame.pack(fill='x')
@@ -129,10 +140,8 @@ class RandomStream(tkinter.Frame):
         tkinter.Label(scale_frame, text="Scale:").pack(
             side=tkinter.LEFT, padx=20, pady=20)
         self.scalerootbox = MyCombobox(
-            scale_frame,
-            values=[takt.Pitch(p).tostr(sfn='#b', octave=False)
-                    for p in range(takt.C4, takt.C5)], initial='C',
-            width=3, validate=self.validate_scale, command=self.master.restart)
+            scale_frame, values=ROOT_NAMES, initial='C', width=3,
+            validate=self.validate_scale, command=self.master.restart)
         self.scalerootbox.pack(side=tkinter.LEFT, padx=20)
         self.scaletypebox = MyCombobox(
             scale_frame, values=self.scalelist, initial='Major', width=14,
@@ -202,58 +211,70 @@ class RandomStream(tkinter.Frame):
         return True
 
     def validate_rhythm(self):
-        try:
-            self.rhythms = [takt.safe_mml(rb.get()).evlist()
-                            for rb in self.rhythmboxes]
-        except takt.MMLError:
-            return False
+        zipped_lists = []
+        for rb in self.rhythmboxes:
+            s = rb.get()
+            if s not in self.rhythm_cache:
+                try:
+                    evlist = takt.safe_mml(s).evlist()
+                except takt.MMLError:
+                    return False
+                self.rhythm_cache[s] = self.zip_rhythm(evlist)
+            if self.rhythm_cache[s] is not None:
+                zipped_lists.append(self.rhythm_cache[s])
+        self.zipped_lists = zipped_lists
         return True
 
+    @staticmethod
+    def zip_rhythm(evlist):
+        notes = evlist.Filter(takt.NoteEvent)
+        ctrls = takt.EventList(evlist.Reject(takt.NoteEvent), duration=0)
+        if not notes:
+            return None
+        t1list = [ev.t for ev in notes]
+        # t2list is a list of the next event's time for each event
+        t2list = t1list[1:] + [notes.duration]
+        ctllist = [ctrls] + [takt.empty() for _ in range(len(notes)-1)]
+        return list(zip(t1list, t2list, notes, ctllist))
+
     def validate_all(self):
         return self.validate_limits() and self.validate_scale() and \
             self.validate_rhythm()
 
     def getscore(self):
         self.validate_all()
-        tonenum_range = (math.ceil(self.scale.tonenum(self.limits[0])),
-                         math.floor(self.scale.tonenum(self.limits[1])) + 1)
-        if self.randtype.get() == 'uniform':
-            pitch_stream = (self.scale[random.randrange(*tonenum_range)]
+        scale = self.scale
+        low = math.ceil(scale.tonenum(self.limits[0]))
+        high = math.floor(scale.tonenum(self.limits[1])) + 1
+        randtype = self.randtype.get()
+        if randtype == 'uniform':
+            randrange = random.randrange
+            pitch_stream = (scale[randrange(low, high)]
+                            for _ in itertools.count())
+        elif randtype == 'Gaussian':
+            gauss = random.gauss
+            mu = (low + high) / 2
+            sigma = (high - low) / 2 / 3
+            pitch_stream = (scale[int(gauss(mu, sigma))]
                             for _ in itertools.count())
-        elif self.randtype.get() == 'Gaussian':
-            pitch_stream = (
-                self.scale[int(random.gauss(
-                    (tonenum_range[0]+tonenum_range[1])/2,
-                    sigma=(tonenum_range[1]-tonenum_range[0])/2/3))]
-                for _ in itertools.count())
-        elif self.randtype.get() == '1/f':
-            rng = Rand1OverF(ndice=3)
-            pitch_stream = (self.scale[rng.randrange(*tonenum_range)]
+        elif randtype == '1/f':
+            randrange = Rand1OverF(ndice=3).randrange
+            pitch_stream = (scale[randrange(low, high)]
                             for _ in itertools.count())
-        elif self.randtype.get() == 'shuffle':
+        elif randtype == 'shuffle':
             ps = self.scale.pitches(self.limits[0], self.limits[1])
             pitch_stream = itertools.chain.from_iterable(
-                random.sample(ps, len(ps)) for _ in itertools.count())
-        elif self.randtype.get() == 'shuffle-repeat':
+                iter(lambda: random.sample(ps, len(ps)), None))
+        elif randtype == 'shuffle-repeat':
             ps = self.scale.pitches(self.limits[0], self.limits[1])
             shuffled = random.sample(ps, len(ps))
-            pitch_stream = itertools.chain.from_iterable(
-                shuffled for _ in itertools.count())
+            pitch_stream = itertools.cycle(shuffled)
 
-        zipped_lists = []
-        for evlist in self.rhythms:
-            notes = evlist.Filter(takt.NoteEvent)
-            ctrls = takt.EventList(evlist.Reject(takt.NoteEvent), duration=0)
-            if notes:
-                t1list = [ev.t for ev in notes]
-                # t2list is a list of the next event's time for each event
-                t2list = t1list[1:] + [notes.duration]
-                ctllist = [ctrls] + [takt.empty() for _ in range(len(notes)-1)]
-                zipped_lists.append(list(zip(t1list, t2list, notes, ctllist)))
+        zipped_lists = self.zipped_lists
         if not zipped_lists:
             return takt.EventList()
         rhythm_stream = itertools.chain.from_iterable(
-            random.choice(zipped_lists) for _ in itertools.count())
+            iter(lambda: random.choice(zipped_lists), None))
         return takt.genseq(
             ctrls + takt.note(n, ev.L, step=t2-t1, v=ev.v,
                               du=ev.get_du(), dt=ev.dt, ch=ev.ch)
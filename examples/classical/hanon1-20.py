@@ -6,6 +6,11 @@
 from pytakt import *
 
 
+# Skeletons of the ascending and descending halves shared by all exercises
+up_base = mml("L2 _{cdefgab}cdefgab")
+down_base = mml("L2 ^cbagfedc_{bagfed}")
+
+
 def hanon(up_pattern, down_pattern=None):
     cscale = Scale(C4, 'major')
     up_pattern = "L16" + up_pattern
@@ -16,8 +21,8 @@ def hanon(up_pattern, down_pattern=None):
     else:
         down_pattern = "L16" + down_pattern
 
-    return mml("L2 _{cdefgab}cdefgab").Product(up_pattern, scale=cscale) + \
-        mml("L2 ^cbagfedc_{bagfed}").Product(down_pattern, scale=cscale)
+    return up_base.Product(up_pattern, scale=cscale) + \
+        down_base.Product(down_pattern, scale=cscale)
 
 
 # No. 1
@@ -2,7 +2,6 @@
 # Bach's Invention in C major and more
 #
 
-import pytakt as takt
 import tkinter
 from tkinter import ttk
 from tkinter.messagebox import showerror
@@ -21,6 +20,7 @@ class MyCombobox(ttk.Combobox):
         # If `addnewvalue' is True, the entered value is appended to `values'
         # unless it is already there.
         self.values = values
+        self.value_set = set(values)  # for fast membership tests
         self.textvar = tkinter.StringVar(value=initial)
         self.validate = validate
         self.command = command
@@ -36,8 +36,9 @@ class MyCombobox(ttk.Combobox):
 
     def on_enter(self, tkevent):
         if self.validate():
-            if self.addnewvalue and self.get() not in self.values:
+            if self.addnewvalue and self.get() not in self.value_set:
                 self.values.append(self.get())
+                self.value_set.add(self.get())
                 self.configure(values=self.values)
         else:
             showerror("Error", f'Bad entered value "{self.get()}"')
@@ -77,6 +78,7 @@ class GUIMain(tkinter.Frame):
                            side=tkinter.LEFT, padx=20)
 
     def validate_motive(self):
+        import pytakt as takt  # deferred as it is needed only here
         try:
             takt.safe_mml(self.motivebox.get())
         except takt.MMLError:
@@ -89,8 +91,13 @@ class GUIMain(tkinter.Frame):
             [sys.executable, Path(__file__).parent / "invention1.py", 'show'])
 
 
-root_window = tkinter.Tk()
-root_window.option_add("*Font", ('TkDefaultFont', 18))
-root_window.title("Pytakt Demo - Bach's Invention in C major and more")
-gui = GUIMain(root_window)
-root_window.mainloop()
+def main():
+    root_window = tkinter.Tk()
+    root_window.option_add("*Font", ('TkDefaultFont', 18))
+    root_window.title("Pytakt Demo - Bach's Invention in C major and more")
+    GUIMain(root_window)
+    root_window.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,17 +6,23 @@ from pytakt.midiio import *
 
 open_input_device()
 loopback_event = LoopBackEvent(0, 'detect_chord')
-chord_buffer = []  # A buffer for storing pitches in the chord
+chord_buffer = bytearray()  # A buffer for storing pitches in the chord
+bass = None  # The lowest pitch in chord_buffer
+profile = [0] * 12  # Chroma profile of chord_buffer
 while True:
     ev = recv_event()
     if isinstance(ev, NoteOnEvent):
         if not chord_buffer:  # For the first note in the chord
             # The second argument below specifies the timestamp.
             queue_event(loopback_event, ev.t + 50)
+        if bass is None or ev.n < bass:
+            bass = ev.n
         chord_buffer.append(ev.n)
+        profile[chroma(ev.n)] += 1
     elif ev is loopback_event:
         if len(chord_buffer) >= 2:
-            chord = Chord.from_chroma_profile(
-                chroma_profile(chord_buffer), bass=min(chord_buffer))
+            chord = Chord.from_chroma_profile(profile, bass=bass)
             print(sorted(chord_buffer), chord.name())
         chord_buffer.clear()
+        bass = None
+        profile[:] = [0] * 12
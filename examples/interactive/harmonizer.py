@@ -4,11 +4,19 @@
 from pytakt import *
 from pytakt.midiio import *
 import tkinter
+import _tkinter
 from tkinter import ttk
 from tkinter.messagebox import showerror
 
 
-GUI_UPDATE_PERIOD = 50  # milliseconds
+# The GUI is polled every GUI_UPDATE_PERIOD_MIN msec while it has events
+# to process; the interval doubles each time it is found idle, up to
+# GUI_UPDATE_PERIOD_MAX msec.
+GUI_UPDATE_PERIOD_MIN = 5
+GUI_UPDATE_PERIOD_MAX = 100
+# Pending GUI events are also processed after this many input notes in a row,
+# so that a burst of MIDI input does not freeze the window.
+MAX_NOTES_PER_UPDATE = 128
 MAXNOTES = 8
 
 
@@ -27,6 +35,14 @@ class GUIMain(tkinter.Frame):
         self.arpeggio = tkinter.IntVar(value=0)
         self.crescendo = tkinter.IntVar(value=0)
         self.echoback = tkinter.BooleanVar()
+        # Plain copies of the variables above, which the main loop can read
+        # without calling into Tcl
+        self.degree_values = [0] * MAXNOTES
+        for i in range(MAXNOTES):
+            self.mirror_var(self.degrees[i], 'degree_values', i)
+        self.mirror_var(self.arpeggio, 'arpeggio_value')
+        self.mirror_var(self.crescendo, 'crescendo_value')
+        self.mirror_var(self.echoback, 'echoback_value')
         self.quitted = False
         super().__init__(master)
         self.create_widgets()
@@ -87,6 +103,19 @@ class GUIMain(tkinter.Frame):
             side=tkinter.LEFT)
         echoback_frame.pack(fill='x')
 
+    def mirror_var(self, var, name, index=None):
+        def update(*args):
+            try:
+                value = var.get()
+            except tkinter.TclError:
+                return  # Keep the last valid value while it is being edited.
+            if index is None:
+                setattr(self, name, value)
+            else:
+                getattr(self, name)[index] = value
+        var.trace_add('write', update)
+        update()
+
     def set_scale(self):
         scroot = self.scaleroot.get()
         sctype = self.scaletype.get()
@@ -109,32 +138,78 @@ root_window.option_add("*Font", ('TkDefaultFont', 18))
 root_window.title("Pytakt Demo - Realtime Harmonizer")
 gui = GUIMain(root_window)
 
-# This application does not use mainloop() - instead, update() is called
-# at regular intervals using the loopback event below.
+
+def process_gui_events():
+    # Process all pending Tk events and return the number of them.
+    nevents = 0
+    while root_window.tk.dooneevent(_tkinter.DONT_WAIT):
+        nevents += 1
+    return nevents
+
+
+# Each event handler below returns True when the application should quit.
+def handle_note(ev):
+    global notes_since_update
+    scale = gui.scale
+    tonenum = scale.tonenum(ev.n)
+    echoback = gui.echoback_value
+    arpeggio = gui.arpeggio_value
+    crescendo = gui.crescendo_value
+    is_note_on = type(ev) is NoteOnEvent
+    delay = 0
+    add_velocity = 0
+    # Output a transposed event for each of the specified degrees
+    for deg in gui.degree_values:
+        if echoback:
+            queue_event(ev)
+        delay += arpeggio
+        add_velocity += crescendo
+        if deg != 0:
+            # Same as Transpose(DEG(deg), scale)(ev), but the tone
+            # number of the input note is computed only once.
+            tev = ev.copy()
+            tev.n = scale[tonenum + DEG(deg)]
+            tev.t += delay
+            if is_note_on:
+                tev.v = max(min(tev.v + add_velocity, 127), 1)
+            queue_event(tev)
+    notes_since_update += 1
+    if notes_since_update >= MAX_NOTES_PER_UPDATE:
+        process_gui_events()
+        notes_since_update = 0
+    return gui.quitted
+
+
+def handle_update(ev):
+    global notes_since_update, update_period
+    nevents = process_gui_events()
+    notes_since_update = 0
+    if gui.quitted:
+        return True
+    update_period = GUI_UPDATE_PERIOD_MIN if nevents else \
+        min(update_period * 2, GUI_UPDATE_PERIOD_MAX)
+    ev.t += update_period
+    queue_event(ev)
+    return False
+
+
+# Dispatch on the exact event class; other MIDI input is ignored.
+event_handlers = {
+    NoteOnEvent: handle_note,
+    NoteOffEvent: handle_note,
+    LoopBackEvent: handle_update,
+}
+
+# This application does not use mainloop() - instead, pending Tk events are
+# processed at intervals using the loopback event below.
 update_event = LoopBackEvent(current_time(), 'update')
 queue_event(update_event)
+update_period = GUI_UPDATE_PERIOD_MIN
+notes_since_update = 0
 
 # main loop
 while True:
     ev = recv_event()  # Receive an event from the MIDI input
-    if isinstance(ev, NoteEventClass):
-        delay = 0
-        add_velocity = 0
-        # Output a transposed event for each of the specified degrees
-        for deg in gui.degrees:
-            if gui.echoback.get():
-                queue_event(ev)
-            delay += gui.arpeggio.get()
-            add_velocity += gui.crescendo.get()
-            if deg.get() != 0:
-                tev = Transpose(DEG(deg.get()), gui.scale)(ev)
-                tev.t += delay
-                if isinstance(ev, NoteOnEvent):
-                    tev.v = max(min(tev.v + add_velocity, 127), 1)
-                queue_event(tev)
-    elif isinstance(ev, LoopBackEvent):
-        root_window.update()
-        if gui.quitted:
-            break
-        ev.t += GUI_UPDATE_PERIOD
-        queue_event(ev)
+    handler = event_handlers.get(type(ev))
+    if handler is not None and handler(ev):
+        break
@@ -1,5 +1,5 @@
 # coding:utf-8
-from pytakt.utils import int_preferred as _int_preferred
+from types import MappingProxyType as _MappingProxyType
 
 TICKS_PER_QUARTER = 480
 """
@@ -9,53 +9,54 @@ Constant defining the length of one tick in the pytakt package.
 pytaktパッケージ内における1ティックの長さを定義している定数です。
 """
 
-L1 = _int_preferred(TICKS_PER_QUARTER * 4)  # whole note
+# The note values below are for TICKS_PER_QUARTER = 480.
+L1 = 1920  # whole note
 ""
-L1DOT = _int_preferred(TICKS_PER_QUARTER * 4 * 1.5)  # dotted whole note
+L1DOT = 2880  # dotted whole note
 ""
-L1DOTDOT = _int_preferred(TICKS_PER_QUARTER * 4 * 1.75)
+L1DOTDOT = 3360
 ""
-L2 = _int_preferred(TICKS_PER_QUARTER * 2)
+L2 = 960
 ""
-L2DOT = _int_preferred(TICKS_PER_QUARTER * 2 * 1.5)
+L2DOT = 1440
 ""
-L2DOTDOT = _int_preferred(TICKS_PER_QUARTER * 2 * 1.75)
+L2DOTDOT = 1680
 ""
-L4 = _int_preferred(TICKS_PER_QUARTER)  # quarter note
+L4 = 480  # quarter note
 ""
-L4DOT = _int_preferred(TICKS_PER_QUARTER * 1.5)
+L4DOT = 720
 ""
-L4DOTDOT = _int_preferred(TICKS_PER_QUARTER * 1.75)
+L4DOTDOT = 840
 ""
-L8 = _int_preferred(TICKS_PER_QUARTER / 2)
+L8 = 240
 ""
-L8DOT = _int_preferred(TICKS_PER_QUARTER / 2 * 1.5)
+L8DOT = 360
 ""
-L8DOTDOT = _int_preferred(TICKS_PER_QUARTER / 2 * 1.75)
+L8DOTDOT = 420
 ""
-L16 = _int_preferred(TICKS_PER_QUARTER / 4)
+L16 = 120
 ""
-L16DOT = _int_preferred(TICKS_PER_QUARTER / 4 * 1.5)
+L16DOT = 180
 ""
-L16DOTDOT = _int_preferred(TICKS_PER_QUARTER / 4 * 1.75)
+L16DOTDOT = 210
 ""
-L32 = _int_preferred(TICKS_PER_QUARTER / 8)
+L32 = 60
 ""
-L32DOT = _int_preferred(TICKS_PER_QUARTER / 8 * 1.5)
+L32DOT = 90
 ""
-L32DOTDOT = _int_preferred(TICKS_PER_QUARTER / 8 * 1.75)
+L32DOTDOT = 105
 ""
-L64 = _int_preferred(TICKS_PER_QUARTER / 16)
+L64 = 30
 ""
-L64DOT = _int_preferred(TICKS_PER_QUARTER / 16 * 1.5)
+L64DOT = 45
 ""
-L64DOTDOT = _int_preferred(TICKS_PER_QUARTER / 16 * 1.75)
+L64DOTDOT = 52.5
 ""
-L128 = _int_preferred(TICKS_PER_QUARTER / 32)
+L128 = 15
 ""
-L128DOT = _int_preferred(TICKS_PER_QUARTER / 32 * 1.5)
+L128DOT = 22.5
 ""
-L128DOTDOT = _int_preferred(TICKS_PER_QUARTER / 32 * 1.75)
+L128DOTDOT = 26.25
 """
 Constants that represent the number of ticks for each note value.
 L\\ :math:`n` means :math:`n`-th notes/rests.
@@ -89,7 +90,7 @@ BEGIN = 1   # used by ties
 END = 2
 
 
-CONTROLLERS = {
+CONTROLLERS = _MappingProxyType({
     0: 'C_BANK',
     1: 'C_MOD',
     2: 'C_BREATH',
@@ -148,19 +149,27 @@ CONTROLLERS = {
     #    132: 'C_VSCALE',   # EXTENDED: velocity scaler
     192: 'C_TEMPO'   # EXTENDED: tempo,
     #    193: 'C_RTEMPO',# EXTENDED: tempo scaler
-}
+})
 """
-A dict object defining the controller numbers.
+A read-only dict-like object defining the controller numbers.
 Each string that is a value of the dict can also be used as an independent
 constant, such as ``ctrl(C_BANK, 1)``.
 """
 """
-コントローラ番号を定義した dictオブジェクトです。
+コントローラ番号を定義した読み出し専用の dict風オブジェクトです。
 値となっている各文字列は、``ctrl(C_BANK, 1)`` のように
 独立した定数としても使用可能です。
 """
 
-META_EVENT_TYPES = {
+CONTROLLERS_REV = {name: num for num, name in CONTROLLERS.items()}
+"""
+A dict object mapping each controller name in CONTROLLERS to its number.
+"""
+"""
+CONTROLLERS にあるコントローラ名から番号への dictオブジェクトです。
+"""
+
+META_EVENT_TYPES = _MappingProxyType({
     0: 'M_SEQNO',
     1: 'M_TEXT',
     2: 'M_COPYRIGHT',
@@ -176,19 +185,28 @@ META_EVENT_TYPES = {
     0x54: 'M_SMPTE',
     0x58: 'M_TIMESIG',
     0x59: 'M_KEYSIG',
-}
+})
 """
-A dict object that defines numbers representing the types of meta-events.
+A read-only dict-like object that defines numbers representing the types
+of meta-events.
 Each string value can also be used as an independent constant.
 """
 """
-メタイベントの種類を表す番号を定義した dictオブジェクトです。
+メタイベントの種類を表す番号を定義した読み出し専用の dict風オブジェクト
+です。
 値となっている各文字列は、独立した定数としても使用可能です。
 """
 
+META_EVENT_TYPES_REV = {name: num for num, name in META_EVENT_TYPES.items()}
+"""
+A dict object mapping each meta-event type name in META_EVENT_TYPES to its
+number.
+"""
+"""
+META_EVENT_TYPES にあるメタイベント種類名から番号への dictオブジェクトです。
+"""
+
 M_TEXT_LIMIT = 0xf
 
-for _k in CONTROLLERS:
-    exec("%s=%d" % (CONTROLLERS[_k], _k))
-for _k in META_EVENT_TYPES:
-    exec("%s=%d" % (META_EVENT_TYPES[_k], _k))
+globals().update(CONTROLLERS_REV)
+globals().update(META_EVENT_TYPES_REV)
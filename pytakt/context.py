@@ -19,9 +19,6 @@ from pytakt.pitch import Key
 __all__ = ['Context', 'context', 'newcontext']
 
 
-thread_local = threading.local()
-
-
 class Context(object):
     """
     The Context class object (context) is a collection of parameters that
@@ -144,6 +141,7 @@ class Context(object):
         effectors:
             Specifies the value of the 'effectors' attribute.
             A copy of the list is assigned to the attribute.
+            If omitted, an empty list is assigned.
         kwargs: specifies additional attributes for the context.
     """
     """ Context クラスのオブジェクト (コンテキスト) は、sc モジュールで
@@ -255,19 +253,22 @@ class Context(object):
             同名の属性値を指定します。
         effectors: effector属性の値を指定します。
             属性にはリストのコピーが格納されます。
+            省略した場合は空のリストが格納されます。
         kwargs: コンテキストに対する追加の属性を指定します。
     """
     __slots__ = ('_dt', '_tk', '_ch', '_v', '_nv', '_L',
                  '_duoffset', '_durate', '_o', '_key',
                  '_effectors_',  # '_effectors' has name conflict with mml.py
-                 '_outer_context', '__dict__')
+                 '__dict__')
     _attributes = ('dt', 'tk', 'ch', 'v', 'nv', 'L',
                    'duoffset', 'durate', 'o', 'key', 'effectors')
     _pseudo_attributes = ('du', 'dr')
+    _attribute_names = frozenset((*_attributes, *_pseudo_attributes))
+    _settable_names = _attribute_names.union(__slots__)
     _newtrack_count = 1
 
     def __init__(self, dt=0, L=L4, v=80, nv=None, duoffset=0, durate=100,
-                 tk=1, ch=1, o=4, key=0, effectors=[], **kwargs):
+                 tk=1, ch=1, o=4, key=0, effectors=None, **kwargs):
         self._dt = dt
         self._L = L
         self._v = v
@@ -278,9 +279,9 @@ class Context(object):
         self._ch = ch
         self._o = o
         self._key = key
-        self._effectors_ = effectors.copy()
-        self._outer_context = None
-        self.__dict__.update(kwargs)
+        self._effectors_ = [] if effectors is None else effectors.copy()
+        if kwargs:
+            self.__dict__.update(kwargs)
 
     def copy(self) -> 'Context':
         """
@@ -291,10 +292,22 @@ class Context(object):
         複製されたコンテキストを返します。effectors 属性値についてはリスト
         の複製が行われます。それ以外の属性については浅いコピーとなります。
         """
-        return self.__class__(self._dt, self._L, self._v, self._nv,
-                              self._duoffset, self._durate, self._tk, self._ch,
-                              self._o, self._key,
-                              self._effectors_, **self.__dict__)
+        # __init__ を経由せずにスロットへ直接代入する (newcontext() の高速化)
+        new = object.__new__(self.__class__)
+        setattr_ = object.__setattr__
+        setattr_(new, '_dt', self._dt)
+        setattr_(new, '_L', self._L)
+        setattr_(new, '_v', self._v)
+        setattr_(new, '_nv', self._nv)
+        setattr_(new, '_duoffset', self._duoffset)
+        setattr_(new, '_durate', self._durate)
+        setattr_(new, '_tk', self._tk)
+        setattr_(new, '_ch', self._ch)
+        setattr_(new, '_o', self._o)
+        setattr_(new, '_key', self._key)
+        setattr_(new, '_effectors_', self._effectors_.copy())
+        new.__dict__.update(self.__dict__)
+        return new
     __copy__ = copy
 
     @property
@@ -409,8 +422,18 @@ class Context(object):
 
     @property
     def du(self):
-        duo = self._duoffset if isinstance(self._duoffset, numbers.Real) \
-            else self._duoffset(self._L)
+        duo = self._duoffset
+        if type(duo) is int and type(self._L) is int and \
+           type(self._durate) is int:
+            # 整数のみの場合は浮動小数点演算と int_preferred を避ける
+            if self._durate == 100:
+                return max(0, duo + self._L)
+            q, r = divmod(self._L * self._durate, 100)
+            if r == 0:
+                return max(0, duo + q)
+        if type(duo) not in (int, float) and \
+           not isinstance(duo, numbers.Real):
+            duo = duo(self._L)
         return int_preferred(max(0, duo + self._L * self._durate / 100))
 
     @du.setter
@@ -433,8 +456,7 @@ class Context(object):
         self._durate = value
 
     def __setattr__(self, name, value):
-        if (name in self._attributes) or (name in self._pseudo_attributes) or \
-           (name in self.__slots__) or (name in self.__dict__):
+        if name in Context._settable_names or name in self.__dict__:
             object.__setattr__(self, name, value)
         else:
             raise AttributeError(
@@ -474,8 +496,7 @@ class Context(object):
         Args:
             name(str): 属性の名前
         """
-        return (name in self._attributes) or \
-            (name in self._pseudo_attributes) or (name in self.__dict__)
+        return name in Context._attribute_names or name in self.__dict__
 
     def reset(self) -> None:
         """
@@ -505,7 +526,12 @@ class Context(object):
         """
         属性名とその値の組のリストを返します。
         """
-        return [(key, getattr(self, key)) for key in self.keys()]
+        return list(self._iter_items())
+
+    def _iter_items(self):
+        for key in self._attributes:
+            yield key, getattr(self, key)
+        yield from self.__dict__.items()
 
     def update(self, **kwargs) -> 'Context':
         """
@@ -521,34 +547,33 @@ class Context(object):
         Returns:
             self
         """
+        names = Context._settable_names
+        setattr_ = object.__setattr__
         for k, v in kwargs.items():
-            setattr(self, k, v)
+            if k in names:
+                setattr_(self, k, v)  # __setattr__ のチェックを省略
+            else:
+                setattr(self, k, v)
         return self
 
     def __repr__(self):
-        attrs = ["%s=%r" % (k, getattr(self, k)) for k in self.keys()]
-        return "<Context: " + str.join(" ", attrs) + ">"
-
-    @staticmethod
-    def _push(ctxt):
-        ctxt._outer_context = context()
-        thread_local.current_context = ctxt
-
-    @staticmethod
-    def _pop():
-        ctxt = context()
-        if ctxt._outer_context is None:
-            raise RuntimeError("pop on empty context stack")
-        thread_local.current_context = ctxt._outer_context
+        return "<Context: %s>" % " ".join(
+            "%s=%r" % item for item in self._iter_items())
 
     # example:
     #  with newcontext(ch=2): note(C4)
+    # コンテキストのスタックはスレッドごとに持ち、インスタンスには
+    # 外側のコンテキストを記録しない (同じコンテキストを複数のスレッドで
+    # 同時に有効にできるようにするため)。
     def __enter__(self):
-        Context._push(self)
+        thread_local.context_stack.append(self)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        Context._pop()
+        stack = thread_local.context_stack
+        if len(stack) <= 1:
+            raise RuntimeError("pop on empty context stack")
+        stack.pop()
 
     def do(self, func, *args, **kwargs) -> Any:
         """ Execute the function `func` in this context and return
@@ -618,6 +643,16 @@ class Context(object):
         return self
 
 
+class _ThreadLocal(threading.local):
+    # __init__ は各スレッドで最初にアクセスしたときに呼ばれる。
+    # スタックの底は、そのスレッドのデフォルトコンテキストとなる。
+    def __init__(self):
+        self.context_stack = [Context()]
+
+
+thread_local = _ThreadLocal()
+
+
 # 理想を言えば context をグローバル変数としたいが、python では import
 # するときにグローバル変数のコピーが行われるので、モジュール内から global文で
 # もって書き換えることができない。
@@ -638,16 +673,19 @@ def context() -> Context:
 class _context_function(object):
     __slots__ = ()
 
-    def __call__(self) -> Context:
-        if not hasattr(thread_local, 'current_context'):
-            thread_local.current_context = Context()
-        return thread_local.current_context
+    def __call__(self, _tls=thread_local) -> Context:
+        return _tls.context_stack[-1]
 
 
 if '__SPHINX_AUTODOC__' not in os.environ:
     context = _context_function()
 
 
+def _outer_context() -> Context:
+    # 現在のコンテキストが with によって有効にされる直前のコンテキストを返す。
+    return thread_local.context_stack[-2]
+
+
 def newcontext(**kwargs) -> Context:
     """
     Returns a copy of the currently active context with attribute values
@@ -42,6 +42,28 @@ def _check_dt(ev):
                       TaktWarning, stacklevel=2)
 
 
+_TONENUM_CACHE_SIZE = 1024
+
+
+def _cached_tonenum(scale, n, cache):
+    # tonenum() の結果は音高と (Pitch であれば) sf だけで決まるので、
+    # 曲中に何度も現れるピッチについてはその結果を使い回す。
+    key = (n, n.sf) if isinstance(n, Pitch) else (type(n), n)
+    try:
+        return cache[key]
+    except KeyError:
+        if len(cache) >= _TONENUM_CACHE_SIZE:
+            cache.clear()
+        tn = cache[key] = scale.tonenum(n)
+        return tn
+
+
+def _unchanged(new, old):
+    # 型や付加情報 (Pitch の sf, cents など) も含めて同じ値であるか
+    return (type(new) is type(old) and new == old and
+            getattr(new, '__dict__', None) == getattr(old, '__dict__', None))
+
+
 class Effector(ABC):
     """ The Effector class is an abstract class on which every effector is
     based.
@@ -113,6 +135,11 @@ class Effector(ABC):
     def __call__(self, score) -> 'Score':
         pass
 
+    def _event_function(self):
+        # mapev() に渡すだけで変換が完結するとき、そのイベント単位の関数を
+        # 返す (CompositeEffector で変換を1回の mapev() にまとめるのに使う)。
+        return None
+
     def __init_subclass__(cls):
         # Scoreのメソッドとしても利用できるようにする。
         if '__SPHINX_AUTODOC__' not in os.environ:
@@ -170,6 +197,10 @@ class EventEffector(Effector):
         else:
             return score_or_event.mapev(self._process_event)
 
+    def _event_function(self):
+        return (self._process_event
+                if type(self).__call__ is EventEffector.__call__ else None)
+
 
 class CompositeEffector(Effector):
     """ A class representing an effector that is a composite of two effectors.
@@ -193,8 +224,37 @@ class CompositeEffector(Effector):
         self.second = second
 
     def __call__(self, score_or_event) -> 'Score':
+        if isinstance(score_or_event, Score):
+            func = self._event_function()
+            if func is not None:
+                # 中間のスコアを作らずに、1回の mapev() で済ませる。
+                return score_or_event.mapev(func)
         return self.second(self.first(score_or_event))
 
+    def _event_function(self):
+        first = (self.first._event_function()
+                 if isinstance(self.first, Effector) else None)
+        second = (self.second._event_function()
+                  if isinstance(self.second, Effector) else None)
+        if first is None or second is None:
+            return None
+
+        def _composite(ev):
+            rtn = first(ev)
+            if isinstance(rtn, Event):
+                return second(rtn)
+            elif rtn is None:
+                return None
+            result = []
+            for subev in rtn:
+                subrtn = second(subev)
+                if isinstance(subrtn, Event):
+                    result.append(subrtn)
+                elif subrtn is not None:
+                    result.extend(subrtn)
+            return result
+        return _composite
+
 
 class Transpose(EventEffector):
     """ Applies a transposition (an operation that raises or lowers the pitch
@@ -271,12 +331,17 @@ class Transpose(EventEffector):
         self.instrument = instrument
         if instrument:
             self.transpose_keysig = False
+        self._tonenum_cache = {}
 
     def _process_event(self, ev) -> 'Event':
         if hasattr(ev, 'n'):
-            ev = ev.copy()
-            ev.n = (ev.n + self.value) if self.scale is None \
-                else self.scale[self.scale.tonenum(ev.n) + self.value]
+            n = (ev.n + self.value) if self.scale is None \
+                else self.scale[_cached_tonenum(self.scale, ev.n,
+                                                self._tonenum_cache)
+                                + self.value]
+            if not _unchanged(n, ev.n):
+                ev = ev.copy()
+                ev.n = n
         elif (self.transpose_keysig and self.scale is None and
               isinstance(ev, KeySignatureEvent)):
             ev = ev.copy()
@@ -291,6 +356,9 @@ class Transpose(EventEffector):
         else:
             return super().__call__(score_or_event)
 
+    def _event_function(self):
+        return None if self.instrument else self._process_event
+
 
 class Invert(EventEffector):
     """ Converts the score to the inverted form. Specifically, given a central
@@ -332,13 +400,20 @@ class Invert(EventEffector):
     def __init__(self, center, scale=None):
         self.center = center
         self.scale = scale
+        # 中心のトーン番号はイベントごとに求める必要がない。
+        self._center_tonenum2 = (None if scale is None
+                                 else scale.tonenum(center) * 2)
+        self._tonenum_cache = {}
 
     def _process_event(self, ev):
         if hasattr(ev, 'n'):
-            ev = ev.copy()
-            ev.n = self.center - (ev.n - self.center) if self.scale is None \
-                else self.scale[self.scale.tonenum(self.center) * 2
-                                - self.scale.tonenum(ev.n)]
+            n = self.center - (ev.n - self.center) if self.scale is None \
+                else self.scale[self._center_tonenum2 -
+                                _cached_tonenum(self.scale, ev.n,
+                                                self._tonenum_cache)]
+            if not _unchanged(n, ev.n):
+                ev = ev.copy()
+                ev.n = n
         return ev
 
 
@@ -380,8 +455,10 @@ class ApplyScale(EventEffector):
 
     def _process_event(self, ev):
         if hasattr(ev, 'n'):
-            ev = ev.copy()
-            ev.n = self.scale.get_near_scale_tone(ev.n, self.round_mode)
+            n = self.scale.get_near_scale_tone(ev.n, self.round_mode)
+            if not _unchanged(n, ev.n):
+                ev = ev.copy()
+                ev.n = n
         return ev
 
 
@@ -421,11 +498,15 @@ class ConvertScale(EventEffector):
                             "the same number of scale tones")
         self.src_scale = src_scale
         self.dst_scale = dst_scale
+        self._tonenum_cache = {}
 
     def _process_event(self, ev):
         if hasattr(ev, 'n'):
-            ev = ev.copy()
-            ev.n = self.dst_scale[self.src_scale.tonenum(ev.n)]
+            n = self.dst_scale[_cached_tonenum(self.src_scale, ev.n,
+                                               self._tonenum_cache)]
+            if not _unchanged(n, ev.n):
+                ev = ev.copy()
+                ev.n = n
         return ev
 
 
@@ -463,17 +544,31 @@ class ScaleVelocity(EventEffector):
           等価なスコアを生成します。
     """
     def __init__(self, value):
-        if isinstance(value, numbers.Real):
+        if type(value) is int and value == 1:
+            self.vfunc = None  # 値を変えない (イベントのコピーも不要)
+        elif isinstance(value, numbers.Real):
             self.vfunc = lambda ev: ev.v * value
         elif isinstance(value, list):
             interpolator = Interpolator(value)
-            self.vfunc = lambda ev: ev.v * interpolator(ev.t)
+            # 和音など同時刻のイベントが続くときは補間を1回で済ませる。
+            last = [(None, None)]  # [(time, multiplier)]
+
+            def vfunc(ev):
+                t, mult = last[0]
+                if t != ev.t:
+                    mult = interpolator(ev.t)
+                    last[0] = (ev.t, mult)
+                return ev.v * mult
+            self.vfunc = vfunc
         else:
             raise Exception("Bad 'value' argument")
 
     def _process_event(self, ev):
-        if hasattr(ev, 'v'):
-            ev = ev.copy().update(v=self.vfunc(ev))
+        if self.vfunc is not None and hasattr(ev, 'v'):
+            v = self.vfunc(ev)
+            if not _unchanged(v, ev.v):
+                ev = ev.copy()
+                ev.v = v
         return ev
 
 
@@ -496,7 +591,11 @@ class Repeat(Effector):
 
     def __call__(self, score):
         if self.rep == math.inf:
-            return genseq(score for i in itertools.count())
+            if not isinstance(score, EventStream):
+                # 時間順に並べたイベントリストを一度だけ作っておき、genseq が
+                # 毎周ソート (Tracks の場合は平坦化も) するコストを小さくする。
+                score = EventList(score, score.get_duration())
+            return genseq(itertools.repeat(score))
         else:
             return score * self.rep
 
@@ -525,7 +624,9 @@ class TimeStretch(Effector):
         self.stretch = stretch
 
     def _scale_time(self, time):
-        return int_preferred(time * self.stretch)
+        time *= self.stretch
+        # 整数倍の伸長では int_preferred() を呼ぶ必要がない。
+        return time if type(time) is int else int_preferred(time)
 
     def _time_stretch(self, ev):
         ev = ev.copy()
@@ -568,17 +669,18 @@ class Retrograde(Effector):
     def __init__(self):
         pass
 
-    def _retrograde(self, ev):
-        if isinstance(ev, NoteEvent):
-            ev = ev.copy()
-            ev.t = self.duration - ev.t - ev.L
-            if hasattr(ev, 'tie'):
-                ev.tie = ((ev.tie & BEGIN) << 1) | ((ev.tie & END) >> 1)
-        return ev
-
     def __call__(self, score):
-        self.duration = score.get_duration()
-        return score.mapev(self._retrograde)
+        # 演奏長はインスタンスに保存せず、クロージャのローカル変数とする。
+        duration = score.get_duration()
+
+        def _retrograde(ev):
+            if isinstance(ev, NoteEvent):
+                ev = ev.copy()
+                ev.t = duration - ev.t - ev.L
+                if hasattr(ev, 'tie'):
+                    ev.tie = ((ev.tie & BEGIN) << 1) | ((ev.tie & END) >> 1)
+            return ev
+        return score.mapev(_retrograde)
 
 
 class Quantize(Effector):
@@ -657,6 +759,16 @@ class Quantize(Effector):
         self.w = tstep * window / 2
         self.keepdur = keepdur
         self.saveorg = saveorg
+        if strength == 1 and window == 1 and type(tstep) is int:
+            self._quantized_time = self._rounded_time
+
+    def _rounded_time(self, tm):
+        # strength=1, window=1 の場合: tstep の倍数のうち最も近いもの
+        # (中間点では大きい方)。整数どうしなら整数演算で求められる。
+        if type(tm) is int:
+            return (tm + self.tstep // 2) // self.tstep * self.tstep
+        else:
+            return Quantize._quantized_time(self, tm)
 
     def _quantized_time(self, tm):
         tx = tm % self.tstep
@@ -746,32 +858,37 @@ class TimeDeform(Effector):
         else:
             period = itpl.maxtime()
             dest_period = itpl(period)
-            self.deformed_time = \
-                lambda t: int_preferred((t // period) * dest_period +
-                                        itpl(t % period))
+
+            def deformed_time(t):
+                q, r = divmod(t, period)
+                return int_preferred(q * dest_period + itpl(r))
+            self.deformed_time = deformed_time
         self.perf_only = perf_only
 
     def _time_deform(self, ev):
+        # 変換後の値をすべて求めてから、コピーしたイベントに代入する。
+        deformed_time = self.deformed_time
+        t = ev.t
+        pt = t + ev.dt
+        time = deformed_time(t)
+        ptime = deformed_time(pt)
         ev = ev.copy()
-        time = self.deformed_time(ev.t)
-        ptime = self.deformed_time(ev.t + ev.dt)
         if isinstance(ev, NoteEvent):
-            offtime = self.deformed_time(ev.t + ev.L)
-            pofftime = self.deformed_time(ev.t + ev.dt + ev.get_du())
-        if self.perf_only:
-            ev.dt = ptime - ev.t
-            _check_dt(ev)
-            if isinstance(ev, NoteEvent):
+            pofftime = deformed_time(pt + ev.get_du())
+            if self.perf_only:
+                ev.dt = ptime - t
                 ev.du = pofftime - ptime
-        else:
-            ev.t = time
-            ev.dt = ptime - time
-            _check_dt(ev)
-            if isinstance(ev, NoteEvent):
-                ev.L = offtime - time
-                if hasattr(ev, 'du') or abs(pofftime - ptime - ev.L) > EPSILON:
+            else:
+                L = deformed_time(t + ev.L) - time
+                (ev.t, ev.dt, ev.L) = (time, ptime - time, L)
+                if hasattr(ev, 'du') or abs(pofftime - ptime - L) > EPSILON:
                     # 元々duが無くても、時間変換の結果、必要になる場合がある。
                     ev.du = pofftime - ptime
+        elif self.perf_only:
+            ev.dt = ptime - t
+        else:
+            (ev.t, ev.dt) = (time, ptime - time)
+        _check_dt(ev)
         return ev
 
     def __call__(self, score):
@@ -903,11 +1020,11 @@ class Randomize(Effector):
             修正されます。
     """
     def __init__(self, time=10, veloc=10, adjust_ctrl=True):
-        self.ftime = ((lambda: max(-time * _RAND_LIMIT,
-                                   min(time * _RAND_LIMIT,
-                                       random.gauss(0, time))))
+        gauss = random.gauss
+        limit = time * _RAND_LIMIT if isinstance(time, numbers.Real) else 0
+        self.ftime = ((lambda: max(-limit, min(limit, gauss(0, time))))
                       if isinstance(time, numbers.Real) else time)
-        self.fveloc = ((lambda: random.gauss(0, veloc))
+        self.fveloc = ((lambda: gauss(0, veloc))
                        if isinstance(veloc, numbers.Real) else veloc)
         self.adjust_ctrl = adjust_ctrl
 
@@ -916,18 +1033,25 @@ class Randomize(Effector):
             if isinstance(ev, (NoteEvent, NoteOnEvent)):
                 self.note_events_in_outq -= 1
             return ev
+        (tk, ch) = (ev.tk, ev.ch)
+        is_kp = isinstance(ev, KeyPressureEvent)
+        ptime = ev.ptime()
+        # このインデックス以降のノートイベントは、evより後に読まれたもの
+        first_in_outq = len(self.notequeue) - self.note_events_in_outq
         for i, (nev, nev_org_ptime) in enumerate(self.notequeue):
-            if (ev.tk == nev.tk and ev.ch == nev.ch and
-                (not isinstance(ev, KeyPressureEvent) or ev.n == nev.n) and
-                ev.ptime() > nev.ptime() and
-                (ev.ptime() < nev_org_ptime or
-                 (ev.ptime() == nev_org_ptime and
+            if tk != nev.tk or ch != nev.ch or (is_kp and ev.n != nev.n):
+                continue
+            nev_ptime = nev.ptime()
+            if (ptime > nev_ptime and
+                (ptime < nev_org_ptime or
+                 (ptime == nev_org_ptime and
                   # evの方がnevより先に入力ストリームから読まれた
-                  i >= len(self.notequeue) - self.note_events_in_outq))):
+                  i >= first_in_outq))):
                 # 該当するノートイベントが複数あるときは、結果的に最小値になる
                 ev = ev.copy()
-                ev.dt = nev.ptime() - ev.t
+                ev.dt = nev_ptime - ev.t
                 _check_dt(ev)
+                ptime = ev.ptime()
         return ev
 
     def _randomize(self, stream):
@@ -935,24 +1059,33 @@ class Randomize(Effector):
         outqueue = deque()  # adjust_ctrl==Falseなら、常に空
         # notequeueは、各CtrlEventについてその前後のNote(On)Eventを見つける
         # ために使われる。
-        self.notequeue = deque()
+        self.notequeue = notequeue = deque()
         self.note_events_in_outq = 0
+        # ループ内で使うものをローカル変数に置く
+        fveloc, ftime = self.fveloc, self.ftime
+        adjust_ctrl = self._adjust_ctrl if self.adjust_ctrl else None
+        outq_window = MAX_DELTA_TIME * 2
+        noteq_window = MAX_DELTA_TIME * 4
 
         try:
             while True:
                 ev = next(stream)
-                while outqueue and outqueue[0].t < ev.t - MAX_DELTA_TIME * 2:
-                    yield self._adjust_ctrl(outqueue.popleft())
-                while (self.notequeue and self.notequeue[0][0].t < ev.t -
-                       MAX_DELTA_TIME * 4):
-                    self.notequeue.popleft()
+                t = ev.t
+                while outqueue and outqueue[0].t < t - outq_window:
+                    yield adjust_ctrl(outqueue.popleft())
+                while notequeue and notequeue[0][0].t < t - noteq_window:
+                    notequeue.popleft()
                 if isinstance(ev, (NoteEvent, NoteOnEvent)):
-                    ev = ev.copy()
-                    ev.v = max(1, min(127, ev.v + self.fveloc()))
-                    r = self.ftime()
-                    self.notequeue.append((ev, ev.ptime()))
-                    ev.dt += r
-                    _check_dt(ev)
+                    v = max(1, min(127, ev.v + fveloc()))
+                    r = ftime()
+                    dt = ev.dt + r
+                    org_ptime = t + ev.dt
+                    # 乱数値が0で値が変わらないときはコピーを省く。
+                    if not (_unchanged(v, ev.v) and _unchanged(dt, ev.dt)):
+                        ev = ev.copy()
+                        (ev.v, ev.dt) = (v, dt)
+                        _check_dt(ev)
+                    notequeue.append((ev, org_ptime))
                     if isinstance(ev, NoteOnEvent):
                         notedict.pushnote(ev, r)
                     self.note_events_in_outq += 1
@@ -963,13 +1096,13 @@ class Randomize(Effector):
                         pass
                     else:
                         ev = ev.copy().update(dt=ev.dt + r)
-                if self.adjust_ctrl:
+                if adjust_ctrl:
                     outqueue.append(ev)
                 else:
                     yield ev
         except StopIteration as e:
             while outqueue:
-                yield self._adjust_ctrl(outqueue.popleft())
+                yield adjust_ctrl(outqueue.popleft())
             return e.value
 
     def __call__(self, score):
@@ -1056,25 +1189,34 @@ class Clip(Effector):
         self.split_notes = split_notes
 
     def _clip(self, ev):
-        if ev.t >= self.e:
+        s, e = self.s, self.e
+        if ev.t >= e:
             if self.isstream:
                 exc = StopIteration()
-                exc.value = self.e
+                exc.value = e
                 raise exc
             return None
-        if self.split_notes and isinstance(ev, NoteEvent):
-            if ev.t < self.s and ev.t + ev.L > self.s:  # start境界を跨ぐ音符
-                cut = self.s - ev.t
-                ev = ev.copy().update(t=self.s, L=ev.L-cut)
+        if (self.split_notes and isinstance(ev, NoteEvent) and
+                (ev.t < s < ev.t + ev.L or
+                 (ev.t >= s and ev.t + ev.L > e))):
+            # 境界を跨ぐ音符 (コピーは一度だけ行う)
+            ev = ev.copy()
+            if ev.t < s:  # start境界を跨ぐ音符
+                cut = s - ev.t
+                (ev.t, ev.L) = (s, ev.L - cut)
                 if hasattr(ev, 'du'):
                     ev.du = max(0, ev.du - cut)
-            if ev.t >= self.s and ev.t + ev.L > self.e:  # end境界を跨ぐ音符
-                ev = ev.copy().update(L=self.e-ev.t)
+            if ev.t + ev.L > e:  # end境界を跨ぐ音符
+                ev.L = e - ev.t
                 if hasattr(ev, 'du'):
                     ev.du = min(ev.du, ev.L)
-        if ev.t >= self.s:
-            if self.s != 0:
-                ev = ev.copy().update(t=ev.t-self.s)
+            if s != 0:
+                ev.t -= s
+            return ev
+        if ev.t >= s:
+            if s != 0:
+                ev = ev.copy()
+                ev.t -= s
             return ev
         elif self.initializer and ev in self.iset:
             return ev.copy().update(t=0)
@@ -1319,21 +1461,32 @@ class Arpeggio(Effector):
 # Undefined = _Undefined()
 
 
-def _event_dict(ev):
-    return dict(ev=ev, t=ev.t, tk=ev.tk, dt=ev.dt,
-                n=getattr(ev, 'n', None),
-                v=getattr(ev, 'v', None),
-                nv=getattr(ev, 'nv', None),
-                ch=getattr(ev, 'ch', None),
-                L=getattr(ev, 'L', None),
-                du=getattr(ev, 'du', ev.get_du()
-                           if isinstance(ev, NoteEvent)
-                           else None),
-                _has_du_=hasattr(ev, 'du'),
-                ctrlnum=getattr(ev, 'ctrlnum', None),
-                mtype=getattr(ev, 'mtype', None),
-                xtype=getattr(ev, 'xtype', None),
-                value=getattr(ev, 'value', None))
+class _EventNamespace(dict):
+    # Filterの条件式や Modifyの文を評価するための名前空間。イベントの属性値
+    # は式の中で参照されたときに ev から取り出す (属性が無ければ None、
+    # NoteEventの du は無ければ L)。
+    # 見つからない名前は locals から探し、それにも無ければ KeyError によって
+    # eval()/exec() に globals を探させる。
+    __slots__ = ('_ev', '_locals')
+    _attrs = frozenset(('t', 'tk', 'dt', 'n', 'v', 'nv', 'ch', 'L', 'du',
+                        '_has_du_', 'ctrlnum', 'mtype', 'xtype', 'value'))
+
+    def __init__(self, ev, locals):
+        super().__init__(ev=ev)
+        self._ev = ev
+        self._locals = locals
+
+    def __missing__(self, key):
+        if key in _EventNamespace._attrs:
+            ev = self._ev
+            if key == 'du':
+                return getattr(ev, 'du', ev.get_du()
+                               if isinstance(ev, NoteEvent) else None)
+            elif key == '_has_du_':
+                return hasattr(ev, 'du')
+            else:
+                return getattr(ev, key, None)
+        return self._locals[key]
 
 
 class Filter(Effector):
@@ -1510,7 +1663,10 @@ class Filter(Effector):
             # issubclassだけだと、condがクラスでないときに例外が発生してしまう
             if hasattr(cond, '__base__') and issubclass(cond, Event):
                 self.eventclasses.append(cond)
-            elif isinstance(cond, str) or callable(cond):
+            elif isinstance(cond, str):
+                # 式はここで一度だけコンパイルしておく
+                self.condexprs.append(compile(cond, '<string>', 'eval'))
+            elif callable(cond):
                 self.condexprs.append(cond)
             else:
                 raise Exception("each argument must be a event class, "
@@ -1522,22 +1678,31 @@ class Filter(Effector):
                        if locals is None else locals)
 
     def _eval_cond(self, cond, ev):
-        if isinstance(cond, str):
+        if callable(cond):
+            return cond(ev)
+        else:
             try:
                 return eval(cond, self.globals,
-                            dict(self.locals, **_event_dict(ev)))
+                            _EventNamespace(ev, self.locals))
             except TypeError:
                 return False
-        else:
-            return cond(ev)
+
+    def _selector(self):
+        # 条件を満たすなら ev、そうでなければ None を返す関数
+        classes = tuple(self.eventclasses)
+        condexprs = self.condexprs
+        negate = self.negate
+        if not condexprs:
+            # イベントクラスだけが指定された場合
+            return (lambda ev:
+                    ev if isinstance(ev, classes) != negate else None)
+        return (lambda ev:
+                ev if ((isinstance(ev, classes) or
+                        any(self._eval_cond(cond, ev) for cond in condexprs))
+                       != negate) else None)
 
     def __call__(self, score):
-        return score.mapev(lambda ev:
-                           ev if ((any(isinstance(ev, cls)
-                                       for cls in self.eventclasses) or
-                                   any(self._eval_cond(cond, ev)
-                                       for cond in self.condexprs))
-                                  != self.negate) else None)
+        return score.mapev(self._selector())
 
 
 class Reject(Filter):
@@ -1610,12 +1775,34 @@ class Cond(Effector):
         if locals is None:
             locals = pytakt.frameutils.outerlocals()
         self.filter_t = Filter(*self.conds, globals=globals, locals=locals)
-        self.filter_f = Filter(*self.conds, negate=True,
-                               globals=globals, locals=locals)
 
     def _do_cond(self, stream):
-        return (self.filter_f(stream.tee()) &
-                self.effector(self.filter_t(stream)))
+        # 条件の評価はイベントごとに1回だけ行い、満たさないものと満たすもの
+        # をそれぞれ queues[0], queues[1] に振り分ける。
+        select = self.filter_t._selector()
+        queues = (deque(), deque())
+        duration = None
+        done = False
+
+        def branch(queue):
+            nonlocal duration, done
+            while True:
+                if queue:
+                    yield queue.popleft()
+                elif done:
+                    return duration
+                else:
+                    try:
+                        ev = next(stream)
+                    except StopIteration as e:
+                        duration = e.value
+                        done = True
+                    else:
+                        queues[select(ev) is not None].append(ev)
+
+        return (stream.__class__(branch(queues[0]), **stream.__dict__) &
+                self.effector(stream.__class__(branch(queues[1]),
+                                               **stream.__dict__)))
 
     def __call__(self, score):
         return score.mapstream(self._do_cond)
@@ -1712,21 +1899,26 @@ class Modify(EventEffector):
     """
     def __init__(self, operation, globals=None, locals=None):
         self.operation = operation
+        self._code = compile(operation, '<string>', 'exec')
         self.globals = (pytakt.frameutils.outerglobals()
                         if globals is None else globals)
         self.locals = (pytakt.frameutils.outerlocals()
                        if locals is None else locals)
 
-    class _du_hooked_dict(dict):
+    class _du_hooked_dict(_EventNamespace):
+        __slots__ = ()
+
         def __setitem__(self, key, value):
             if key == 'du':
                 super().__setitem__('_has_du_', True)
             super().__setitem__(key, value)
 
     def _process_event(self, ev):
-        env = self._du_hooked_dict(self.locals, **_event_dict(ev.copy()))
+        # 属性値は元のイベントから取り出し、'ev' はコピーを指すようにする。
+        env = self._du_hooked_dict(ev, self.locals)
+        env['ev'] = ev.copy()
         try:
-            exec(self.operation, self.globals, env)
+            exec(self._code, self.globals, env)
         except TypeError:
             return ev
         ev = env['ev']
@@ -307,26 +307,27 @@ class Interpolator(object):
                 spline_point_count = 0
 
     def __call__(self, t) -> float:
+        plist = self.plist
         i = bisect_right(self.tlist, t)
         if i == 0:
-            return self.plist[0].value
-        elif i == len(self.plist):
-            return self.plist[-1].value
-        elif self.plist[i]._lslope() is None:
-            return self.plist[i-1].value
-        elif self.plist[i]._lslope() == 1 and self.plist[i-1]._rslope() == 1:
+            return plist[0].value
+        elif i == len(plist):
+            return plist[-1].value
+        p0, p1 = plist[i-1], plist[i]
+        lslope = p1._lslope()
+        if lslope is None:
+            return p0.value
+        elif lslope == 1 and p0._rslope() == 1:
             # elseにある3次補間でも計算できるが、下の式の方が精度的に有利。
-            return ((t - self.plist[i-1].t) * self.plist[i].m
-                    + self.plist[i-1].value)
+            return (t - p0.t) * p1.m + p0.value
         else:
-            h = self.plist[i].t - self.plist[i-1].t
-            m = self.plist[i].m
-            p2 = 3 * m - self.plist[i].lderiv - 2 * self.plist[i-1].rderiv
-            p3 = self.plist[i].lderiv + self.plist[i-1].rderiv - 2 * m
-            a = t - self.plist[i-1].t
+            h = p1.t - p0.t
+            m = p1.m
+            p2 = 3 * m - p1.lderiv - 2 * p0.rderiv
+            p3 = p1.lderiv + p0.rderiv - 2 * m
+            a = t - p0.t
             b = a / h
-            return (((p3 * b + p2) * b + self.plist[i-1].rderiv) * a
-                    + self.plist[i-1].value)
+            return ((p3 * b + p2) * b + p0.rderiv) * a + p0.value
 
     def iterator(self, tstep, ystep=-1) -> Iterator[Tuple[Ticks, float]]:
         """
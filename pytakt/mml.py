@@ -21,7 +21,7 @@ from arpeggio import ZeroOrMore, Optional, RegExMatch, EOF, \
                      NonTerminal, ParserPython, NoMatch, Sequence
 from fractions import Fraction
 from pytakt.score import Score, EventList
-from pytakt.context import context, newcontext, Context
+from pytakt.context import context, newcontext, Context, _outer_context
 from pytakt.pitch import Pitch
 from pytakt.constants import L1, L64
 from pytakt.sc import note, rest
@@ -238,11 +238,11 @@ class MMLAction(object):
 
     @staticmethod
     def cmd_octaveup():
-        context()._outer_context.o += 1
+        _outer_context().o += 1
 
     @staticmethod
     def cmd_octavedown():
-        context()._outer_context.o -= 1
+        _outer_context().o -= 1
 
     @staticmethod
     def cmd_undefined(char):
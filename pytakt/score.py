@@ -1821,10 +1821,10 @@ class EventList(Score, list):
         """
         if not isinstance(other, EventList):
             raise TypeError("can only merge/concat event-list to event-list")
-        for ev in other:
-            if time != 0:
+        if time != 0:
+            for ev in other:
                 ev.t = int_preferred(ev.t + time)
-            self.append(ev)
+        self.extend(other)
         self.duration = max(self.duration,
                             int_preferred(other.duration + time))
 
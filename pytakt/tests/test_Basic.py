@@ -172,6 +172,10 @@ def test_effectors():
     assert mml("CD/").Filter('L >= L4') == mml("Cr/")
     assert mml("C4 C5 C6 $kpr(C6, 100)").Cond('n >= C5', ScaleVelocity(1.2)) \
         == mml("C4 C5(v=96) C6(v=96) $kpr(C6, 100)")
+    evaluated = []
+    assert mml("CDE").Cond(lambda ev: evaluated.append(ev) or ev.n > C4,
+                           ScaleVelocity(1.2)) == mml("C D(v=96) E(v=96)")
+    assert len(evaluated) == 3
     assert mml("$tempo(150) C $prog(4)").Modify('ch=3') \
         == mml("ch=3 $tempo(150) C $prog(4)")
     assert mml("$vol(7)CDE").Modify('v*=0.8; nv=30') \